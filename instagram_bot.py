@@ -1,9 +1,15 @@
+import asyncio
+import itertools
 import logging
 import re
-import requests
+from types import MappingProxyType
+import ahocorasick
+import aiohttp
+import orjson
+from cachetools import TTLCache
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import instaloader
 
 # Enable logging
@@ -13,10 +19,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Browser-like headers for all outbound fetches; frozen against mutation
+_UA_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Precompiled regex patterns (avoids re-parsing patterns on every call)
+# Accepts profile URLs, @username and bare usernames in one fully anchored
+# match; the end anchor rejects free text like "hello world", and only the
+# URL form may carry a trailing /... or ?... suffix
+_USERNAME_RE = re.compile(
+    r'^(?:(?:https?://)?(?:www\.)?instagram\.com/([A-Za-z0-9_.]+)(?:[/?].*)?'
+    r'|@?([A-Za-z0-9_.]+))$'
+)
+
+# Fallback for a profile URL embedded in surrounding text
+_EMBEDDED_URL_RE = re.compile(r'instagram\.com/([A-Za-z0-9_.]+)')
+
+# Translation table beats regex substitution for single-char escapes
+_MD_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in '*_`[]()~>#+=|{}.!-'})
+
+# Both letter cases are spelled out, so no IGNORECASE flag is needed
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+
+# Single alternation so the bio is scanned once instead of once per pattern
+_PHONE_PATTERN = '|'.join(f'(?:{p})' for p in (
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',
+    r'\b\d{10}\b',
+    r'\b\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b'
+))
+
+# Platform aliases share a factored prefix; the named group captures the handle
+_SOCIAL_PATTERNS = {
+    'telegram': r'(?:telegram|tg)[: ]*@(?P<telegram>[A-Za-z0-9_]+)',
+    'whatsapp': r'(?:whatsapp|wa)[: ]*(?P<whatsapp>[0-9+()\- ]+)',
+    'signal': r'signal[: ]*(?P<signal>[0-9+()\- ]+)',
+    'snapchat': r'(?:snapchat|snap)[: ]*@(?P<snapchat>[A-Za-z0-9_]+)',
+    'twitter': r'(?:twitter|twt)[: ]*@(?P<twitter>[A-Za-z0-9_]+)'
+}
+
+# All bio contact patterns fused into one pass; m.lastgroup names the match
+# kind. Case-sensitive: the bio is lowercased once before matching, which is
+# cheaper than carrying IGNORECASE through every state transition.
+_BIO_RE = re.compile(
+    f'(?P<email>{_EMAIL_PATTERN})|'
+    + '|'.join(_SOCIAL_PATTERNS.values())
+    + f'|(?P<phone>{_PHONE_PATTERN})'
+)
+
+# Email/phone-only variant used when socials are found via the keyword automaton
+_EMAIL_PHONE_RE = re.compile(
+    f'(?P<email>{_EMAIL_PATTERN})|(?P<phone>{_PHONE_PATTERN})'
+)
+
+# For long bios a keyword automaton finds platform mentions in one linear scan,
+# independent of how many platforms we track; a small suffix regex then grabs
+# the handle/number. Below this length the fused regex is cheaper.
+_AC_MIN_BIO_LEN = 1024
+
+_NUMBER_PLATFORMS = frozenset({'whatsapp', 'signal'})
+_HANDLE_SUFFIX_RE = re.compile(r'[: ]*@([A-Za-z0-9_]+)')
+_NUMBER_SUFFIX_RE = re.compile(r'[: ]*([0-9+()\- ]+)')
+
+
+def _build_social_automaton():
+    automaton = ahocorasick.Automaton()
+    for platform, aliases in (
+        ('telegram', ('telegram', 'tg')),
+        ('whatsapp', ('whatsapp', 'wa')),
+        ('signal', ('signal',)),
+        ('snapchat', ('snapchat', 'snap')),
+        ('twitter', ('twitter', 'twt')),
+    ):
+        for alias in aliases:
+            automaton.add_word(alias, platform)
+    automaton.make_automaton()
+    return automaton
+
+
+_SOCIAL_AUTOMATON = _build_social_automaton()
+
+# Locates and extracts the profile JSON from Instagram's HTML in one scan
+_SHARED_DATA_RE = re.compile(r'window\._sharedData\s*=\s*(\{.*?\});</script>', re.DOTALL)
+
+# Only anchor tags matter for website contact extraction
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+# Contacts almost always sit in the first screenful or the footer; reading
+# more than this from an arbitrary external site is wasted work
+_MAX_WEBSITE_BYTES = 256 * 1024
+
+# Concurrent to_thread lookups each get their own instaloader (and thus their
+# own requests.Session) instead of contending on one shared context
+_LOADER_POOL_SIZE = 4
+
+# Telegram messages cap at 4096 chars; stay a little under
+_MAX_MESSAGE_LEN = 4000
+
+
+def _iter_message_chunks(text: str, limit: int = _MAX_MESSAGE_LEN):
+    """Yield message-sized chunks lazily, preferring to split at a newline."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = start + limit
+        if end >= length:
+            yield text[start:]
+            return
+        # Break at a newline near the cap so chunks don't split mid-line
+        cut = text.rfind('\n', end - 200, end)
+        if cut > start:
+            end = cut + 1
+        yield text[start:end]
+        start = end
+
 class InstagramBot:
     def __init__(self):
-        self.loader = instaloader.Instaloader()
-        
+        self.loaders = [instaloader.Instaloader() for _ in range(_LOADER_POOL_SIZE)]
+        self._loader_idx = itertools.cycle(range(_LOADER_POOL_SIZE))
+        # Created lazily on the running event loop; reused for keep-alive
+        self.http = None
+        # Short-circuit repeat lookups instead of re-hitting Instagram
+        self.profile_cache = TTLCache(maxsize=1024, ttl=300)
+        self.website_cache = TTLCache(maxsize=1024, ttl=3600)
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use."""
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(
+                headers=_UA_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.http
+
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Send welcome message when command /start is issued."""
         await update.message.reply_text(
@@ -51,34 +189,25 @@ class InstagramBot:
 
     def extract_username(self, text: str) -> str:
         """Extract username from various Instagram URL formats."""
-        text = text.replace('@', '')
-        
-        patterns = [
-            r'instagram\.com/([A-Za-z0-9_.]+)/?',
-            r'instagram\.com/([A-Za-z0-9_.]+)\?',
-            r'^([A-Za-z0-9_.]+)$'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                username = match.group(1)
-                username = username.split('/')[0].split('?')[0]
-                return username
-        return None
+        text = text.strip()
+        match = _USERNAME_RE.match(text)
+        if match:
+            return match.group(1) or match.group(2)
+        match = _EMBEDDED_URL_RE.search(text)
+        return match.group(1) if match else None
 
     def clean_text(self, text: str) -> str:
         """Clean text to prevent Markdown formatting issues."""
         if not text:
             return ""
-        # Remove or escape Markdown special characters
-        text = re.sub(r'([*_`\[\]()~>#+=|{}.!-])', r'\\\1', text)
-        return text
+        # Escape Markdown special characters
+        return text.translate(_MD_ESCAPE_TABLE)
 
     def get_profile_info_instaloader(self, username: str) -> dict:
         """Get profile info using instaloader."""
         try:
-            profile = instaloader.Profile.from_username(self.loader.context, username)
+            ctx = self.loaders[next(self._loader_idx)].context
+            profile = instaloader.Profile.from_username(ctx, username)
             
             return {
                 'username': profile.username,
@@ -97,41 +226,37 @@ class InstagramBot:
             logger.error(f"Instaloader error: {e}")
             return None
 
-    def get_profile_info_web(self, username: str) -> dict:
+    async def get_profile_info_web(self, username: str) -> dict:
         """Get profile info using web scraping (fallback method)."""
         try:
             url = f"https://www.instagram.com/{username}/"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            http = await self._get_http()
+            async with http.get(url) as response:
+                html = await response.text()
+
+            # Locate the sharedData blob directly; no need to build a DOM for it
+            blob = _SHARED_DATA_RE.search(html)
+            if not blob:
+                return None
+            data = orjson.loads(blob.group(1))
+
+            try:
+                profile_data = data['entry_data']['ProfilePage'][0]['graphql']['user']
+            except (KeyError, IndexError):
+                return None
+
+            return {
+                'username': profile_data.get('username'),
+                'full_name': self.clean_text(profile_data.get('full_name', '')),
+                'biography': self.clean_text(profile_data.get('biography', '')),
+                'followers': profile_data.get('edge_followed_by', {}).get('count'),
+                'following': profile_data.get('edge_follow', {}).get('count'),
+                'posts': profile_data.get('edge_owner_to_timeline_media', {}).get('count'),
+                'is_private': profile_data.get('is_private'),
+                'is_verified': profile_data.get('is_verified'),
+                'profile_pic_url': profile_data.get('profile_pic_url_hd'),
+                'external_url': profile_data.get('external_url')
             }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if 'window._sharedData' in script.text:
-                    data_str = script.text.split('window._sharedData = ')[1].split(';</script>')[0]
-                    import json
-                    data = json.loads(data_str)
-                    
-                    try:
-                        profile_data = data['entry_data']['ProfilePage'][0]['graphql']['user']
-                        return {
-                            'username': profile_data.get('username'),
-                            'full_name': self.clean_text(profile_data.get('full_name', '')),
-                            'biography': self.clean_text(profile_data.get('biography', '')),
-                            'followers': profile_data.get('edge_followed_by', {}).get('count'),
-                            'following': profile_data.get('edge_follow', {}).get('count'),
-                            'posts': profile_data.get('edge_owner_to_timeline_media', {}).get('count'),
-                            'is_private': profile_data.get('is_private'),
-                            'is_verified': profile_data.get('is_verified'),
-                            'profile_pic_url': profile_data.get('profile_pic_url_hd'),
-                            'external_url': profile_data.get('external_url')
-                        }
-                    except (KeyError, IndexError):
-                        continue
-            return None
         except Exception as e:
             logger.error(f"Web scraping error: {e}")
             return None
@@ -146,89 +271,88 @@ class InstagramBot:
         
         if not bio:
             return contacts
-        
-        # Email patterns
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, bio, re.IGNORECASE)
-        contacts['emails'] = list(set(email_matches))
-        
-        # Phone patterns
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',
-            r'\b\d{10}\b',
-            r'\b\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b'
-        ]
-        
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, bio)
-            contacts['phones'].extend(phone_matches)
-        contacts['phones'] = list(set(contacts['phones']))
-        
-        # Social media handles
-        social_patterns = {
-            'telegram': r'telegram[: ]*@([A-Za-z0-9_]+)|tg[: ]*@([A-Za-z0-9_]+)',
-            'whatsapp': r'whatsapp[: ]*([0-9+()\- ]+)|wa[: ]*([0-9+()\- ]+)',
-            'signal': r'signal[: ]*([0-9+()\- ]+)',
-            'snapchat': r'snapchat[: ]*@([A-Za-z0-9_]+)|snap[: ]*@([A-Za-z0-9_]+)',
-            'twitter': r'twitter[: ]*@([A-Za-z0-9_]+)|twt[: ]*@([A-Za-z0-9_]+)'
-        }
-        
-        for platform, pattern in social_patterns.items():
-            matches = re.findall(pattern, bio, re.IGNORECASE)
-            for match in matches:
-                # Handle multiple groups in pattern
-                for group in match:
-                    if group and group.strip():
-                        contacts['social_handles'].append(f"{platform.title()}: {group.strip()}")
-                        break
-        
-        # Remove duplicates
-        contacts['social_handles'] = list(set(contacts['social_handles']))
-        
+
+        # Deduplicate as matches are found
+        seen = {'emails': set(), 'phones': set(), 'social_handles': set()}
+
+        def add(bucket, value):
+            if value not in seen[bucket]:
+                seen[bucket].add(value)
+                contacts[bucket].append(value)
+
+        # Lowercase once; handles and emails are conventionally lowercase
+        # anyway and it lets every pattern run case-sensitive
+        bio_lower = bio.lower()
+
+        if len(bio_lower) >= _AC_MIN_BIO_LEN:
+            # Long bio: find platform keywords with the automaton, then match
+            # only the short handle/number suffix at each hit
+            for end, platform in _SOCIAL_AUTOMATON.iter(bio_lower):
+                suffix = _NUMBER_SUFFIX_RE if platform in _NUMBER_PLATFORMS else _HANDLE_SUFFIX_RE
+                match = suffix.match(bio_lower, end + 1)
+                if match and match.group(1).strip():
+                    add('social_handles', f"{platform.title()}: {match.group(1).strip()}")
+            pattern = _EMAIL_PHONE_RE
+        else:
+            # Short bio: one fused scan covers everything
+            pattern = _BIO_RE
+
+        for match in pattern.finditer(bio_lower):
+            kind = match.lastgroup
+            value = match.group(kind)
+
+            if kind == 'email':
+                bucket = 'emails'
+            elif kind == 'phone':
+                bucket = 'phones'
+            else:
+                value = value.strip()
+                if not value:
+                    continue
+                value = f"{kind.title()}: {value}"
+                bucket = 'social_handles'
+
+            add(bucket, value)
+
         return contacts
 
-    def get_contacts_from_website(self, url: str) -> dict:
+    async def get_contacts_from_website(self, url: str) -> dict:
         """Try to extract contacts from linked website."""
         website_contacts = {
             'emails': [],
             'phones': [],
             'contact_links': []
         }
-        
+
         try:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=8)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract emails from mailto links
-            mailto_links = soup.find_all('a', href=re.compile(r'mailto:'))
-            for link in mailto_links:
-                email = link['href'].replace('mailto:', '').split('?')[0]
-                if email and '@' in email:
-                    website_contacts['emails'].append(email)
-            
-            # Extract emails from text
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            text_emails = re.findall(email_pattern, soup.get_text())
-            website_contacts['emails'].extend(text_emails)
-            
-            # Extract phones
-            tel_links = soup.find_all('a', href=re.compile(r'tel:'))
-            for link in tel_links:
-                phone = link['href'].replace('tel:', '')
-                if phone:
-                    website_contacts['phones'].append(phone)
-            
-            # Remove duplicates
-            website_contacts['emails'] = list(set(website_contacts['emails']))[:3]
-            website_contacts['phones'] = list(set(website_contacts['phones']))[:3]
+
+            http = await self._get_http()
+            async with http.get(url, timeout=aiohttp.ClientTimeout(total=8)) as response:
+                # Cap the read so megabyte pages don't blow up memory/CPU
+                raw = await response.content.read(_MAX_WEBSITE_BYTES)
+            html = raw.decode('utf-8', errors='ignore')
+
+            # Parse only anchor tags; everything else on the page is irrelevant
+            soup = BeautifulSoup(html, 'lxml', parse_only=_ANCHOR_STRAINER)
+            for link in soup.find_all('a'):
+                href = link.get('href', '')
+                if href.startswith('mailto:'):
+                    email = href[len('mailto:'):].split('?')[0]
+                    if email and '@' in email:
+                        website_contacts['emails'].append(email)
+                elif href.startswith('tel:'):
+                    phone = href[len('tel:'):]
+                    if phone:
+                        website_contacts['phones'].append(phone)
+
+            # Extract emails from the raw body; skips rebuilding the page text
+            website_contacts['emails'].extend(_EMAIL_RE.findall(html))
+
+            # Remove duplicates, keeping first-seen order
+            website_contacts['emails'] = list(dict.fromkeys(website_contacts['emails']))[:3]
+            website_contacts['phones'] = list(dict.fromkeys(website_contacts['phones']))[:3]
             
         except Exception as e:
             logger.error(f"Website contact extraction error: {e}")
@@ -237,79 +361,74 @@ class InstagramBot:
 
     def format_contact_response(self, contacts: dict, website_contacts: dict) -> str:
         """Format contact information into readable response."""
-        response = ""
-        
+        parts = []
+
         has_bio_contacts = any(contacts['emails'] or contacts['phones'] or contacts['social_handles'])
         has_website_contacts = any(website_contacts['emails'] or website_contacts['phones'])
-        
+
         if has_bio_contacts:
-            response += "📞 Contact Information from Bio:\n"
-            
+            parts.append("📞 Contact Information from Bio:\n")
+
             if contacts['emails']:
-                response += "📧 Emails:\n"
-                for email in contacts['emails']:
-                    response += f"   • {email}\n"
-            
+                parts.append("📧 Emails:\n")
+                parts.extend(f"   • {email}\n" for email in contacts['emails'])
+
             if contacts['phones']:
-                response += "📱 Phones:\n"
-                for phone in contacts['phones']:
-                    response += f"   • {phone}\n"
-            
+                parts.append("📱 Phones:\n")
+                parts.extend(f"   • {phone}\n" for phone in contacts['phones'])
+
             if contacts['social_handles']:
-                response += "💬 Social Handles:\n"
-                for handle in contacts['social_handles'][:5]:
-                    response += f"   • {handle}\n"
-        
+                parts.append("💬 Social Handles:\n")
+                parts.extend(f"   • {handle}\n" for handle in contacts['social_handles'][:5])
+
         if has_website_contacts:
             if has_bio_contacts:
-                response += "\n"
-            response += "🌐 Contact Information from Website:\n"
-            
+                parts.append("\n")
+            parts.append("🌐 Contact Information from Website:\n")
+
             if website_contacts['emails']:
-                response += "📧 Website Emails:\n"
-                for email in website_contacts['emails']:
-                    response += f"   • {email}\n"
-            
+                parts.append("📧 Website Emails:\n")
+                parts.extend(f"   • {email}\n" for email in website_contacts['emails'])
+
             if website_contacts['phones']:
-                response += "📱 Website Phones:\n"
-                for phone in website_contacts['phones']:
-                    response += f"   • {phone}\n"
-        
+                parts.append("📱 Website Phones:\n")
+                parts.extend(f"   • {phone}\n" for phone in website_contacts['phones'])
+
         if not has_bio_contacts and not has_website_contacts:
-            response = "❌ No contact information found in bio or linked website.\nContact details are only available if the user shares them publicly."
-        
-        return response
+            return "❌ No contact information found in bio or linked website.\nContact details are only available if the user shares them publicly."
+
+        return "".join(parts)
 
     def format_profile_response(self, profile_info: dict, username: str, contacts: dict, website_contacts: dict) -> str:
         """Format the profile information into a readable response."""
-        response = f"📱 Instagram Profile Info\n\n"
-        response += f"Username: @{profile_info.get('username', username)}\n"
-        
+        parts = ["📱 Instagram Profile Info\n\n"]
+        parts.append(f"Username: @{profile_info.get('username', username)}\n")
+
         if profile_info.get('full_name'):
-            response += f"👤 Name: {profile_info['full_name']}\n"
-        
+            parts.append(f"👤 Name: {profile_info['full_name']}\n")
+
         if profile_info.get('followers') is not None:
-            response += f"👥 Followers: {profile_info['followers']:,}\n"
-        
+            parts.append(f"👥 Followers: {profile_info['followers']:,}\n")
+
         if profile_info.get('following') is not None:
-            response += f"🔄 Following: {profile_info['following']:,}\n"
-        
+            parts.append(f"🔄 Following: {profile_info['following']:,}\n")
+
         if profile_info.get('posts') is not None:
-            response += f"📸 Posts: {profile_info['posts']:,}\n"
-        
+            parts.append(f"📸 Posts: {profile_info['posts']:,}\n")
+
         if profile_info.get('biography'):
             bio = profile_info['biography']
             # Truncate very long bios
             if len(bio) > 500:
                 bio = bio[:500] + "..."
-            response += f"📝 Bio: {bio}\n"
-        
+            parts.append(f"📝 Bio: {bio}\n")
+
         if profile_info.get('external_url'):
-            response += f"🔗 Website: {profile_info['external_url']}\n"
-        
+            parts.append(f"🔗 Website: {profile_info['external_url']}\n")
+
         if profile_info.get('business_category'):
-            response += f"💼 Category: {profile_info['business_category']}\n"
-        
+            parts.append(f"💼 Category: {profile_info['business_category']}\n")
+
         # Status indicators
         status = []
         if profile_info.get('is_private'):
@@ -318,18 +437,18 @@ class InstagramBot:
             status.append("🔓 Public")
         if profile_info.get('is_verified'):
             status.append("✅ Verified")
-        
+
         if status:
-            response += f"\nStatus: {' | '.join(status)}\n"
-        
+            parts.append(f"\nStatus: {' | '.join(status)}\n")
+
         # Add contact information
         contact_response = self.format_contact_response(contacts, website_contacts)
         if contact_response:
-            response += f"\n{contact_response}"
-        
-        response += f"\n🔗 Profile URL: https://www.instagram.com/{username}/"
-        
-        return response
+            parts.append(f"\n{contact_response}")
+
+        parts.append(f"\n🔗 Profile URL: https://www.instagram.com/{username}/")
+
+        return "".join(parts)
 
     async def handle_instagram_url(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle Instagram profile URLs."""
@@ -351,13 +470,25 @@ class InstagramBot:
         await update.message.chat.send_action(action="typing")
         
         try:
-            # Try instaloader first
-            profile_info = self.get_profile_info_instaloader(username)
-            
-            # If instaloader fails, try web scraping
+            # Serve recently fetched profiles from the cache
+            profile_info = self.profile_cache.get(username)
+
             if not profile_info:
-                await update.message.chat.send_action(action="typing")
-                profile_info = self.get_profile_info_web(username)
+                # Start the web-scrape fallback speculatively alongside
+                # instaloader so a fallback costs max() instead of sum()
+                insta_task = asyncio.create_task(
+                    asyncio.to_thread(self.get_profile_info_instaloader, username)
+                )
+                web_task = asyncio.create_task(self.get_profile_info_web(username))
+
+                profile_info = await insta_task
+                if profile_info:
+                    web_task.cancel()
+                else:
+                    profile_info = await web_task
+
+                if profile_info:
+                    self.profile_cache[username] = profile_info
             
             if profile_info:
                 # Check if profile is private
@@ -372,24 +503,31 @@ class InstagramBot:
                 # Extract contact information
                 await update.message.chat.send_action(action="typing")
                 bio = profile_info.get('biography', '')
-                contacts = self.extract_contact_from_bio(bio)
-                
-                # Extract website contacts if available
+
+                # Bio extraction and the website fetch are independent,
+                # so overlap the regex work with the network wait
                 website_contacts = {'emails': [], 'phones': [], 'contact_links': []}
-                if profile_info.get('external_url'):
-                    await update.message.chat.send_action(action="typing")
-                    website_contacts = self.get_contacts_from_website(profile_info['external_url'])
+                external_url = profile_info.get('external_url')
+                if external_url:
+                    cached = self.website_cache.get(external_url)
+                    if cached is not None:
+                        contacts = self.extract_contact_from_bio(bio)
+                        website_contacts = cached
+                    else:
+                        contacts, website_contacts = await asyncio.gather(
+                            asyncio.to_thread(self.extract_contact_from_bio, bio),
+                            self.get_contacts_from_website(external_url)
+                        )
+                        self.website_cache[external_url] = website_contacts
+                else:
+                    contacts = self.extract_contact_from_bio(bio)
                 
                 # Format and send response (without Markdown to avoid parsing errors)
                 response = self.format_profile_response(profile_info, username, contacts, website_contacts)
                 
-                # Split message if too long
-                if len(response) > 4000:
-                    parts = [response[i:i+4000] for i in range(0, len(response), 4000)]
-                    for part in parts:
-                        await update.message.reply_text(part)
-                else:
-                    await update.message.reply_text(response)
+                # Split message if too long, sending each chunk as produced
+                for chunk in _iter_message_chunks(response):
+                    await update.message.reply_text(chunk)
                 
             else:
                 await update.message.reply_text(